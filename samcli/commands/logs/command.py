@@ -3,6 +3,7 @@ CLI command for "logs" command
 """
 
 import logging
+from pathlib import Path
 
 import click
 
@@ -84,6 +85,22 @@ DESCRIPTION = """
     "When provided, it will only tail the given CloudWatch Log groups. If you want to tail log groups related "
     "to resources, please also provide their names as well",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Don't use the resource information of the stack which is cached by previous invocations with the same "
+    "--profile for a short period of time, and always fetch it from AWS CloudFormation. Resource information is "
+    "only cached when a --profile is given.",
+)
+@click.option(
+    "--live-tail",
+    is_flag=True,
+    help="Tail CloudWatch log groups through CloudWatch Logs Live Tail sessions instead of polling them, "
+    "only used together with --tail. A Live Tail session is started for each log group and is billed per "
+    "session minute, see https://aws.amazon.com/cloudwatch/pricing/. When log events are ingested faster than "
+    "Live Tail can stream them, the session samples them and some of the log events won't be displayed. "
+    "Log groups which a session can't be started for are polled instead.",
+)
 @common_observability_options
 @cli_framework_options
 @aws_creds_options
@@ -104,6 +121,8 @@ def cli(
     end_time,
     output,
     cw_log_group,
+    no_cache,
+    live_tail,
     config_file,
     config_env,
 ):  # pylint: disable=redefined-builtin
@@ -122,11 +141,20 @@ def cli(
         end_time,
         cw_log_group,
         output,
+        no_cache,
+        live_tail,
         ctx.region,
         ctx.profile,
     )  # pragma: no cover
 
 
+def _live_tail_supported(boto_client_provider) -> bool:
+    """
+    Returns True if installed botocore version knows about CloudWatch Logs StartLiveTail API
+    """
+    return "StartLiveTail" in boto_client_provider("logs").meta.service_model.operation_names
+
+
 def do_cli(
     names,
     stack_name,
@@ -137,6 +165,8 @@ def do_cli(
     end_time,
     cw_log_groups,
     output,
+    no_cache,
+    live_tail,
     region,
     profile,
 ):
@@ -146,10 +176,15 @@ def do_cli(
 
     from datetime import datetime
 
-    from samcli.commands.logs.logs_context import ResourcePhysicalIdResolver, parse_time
+    from samcli.cli.global_config import GlobalConfig
+    from samcli.commands.logs.logs_context import ResourcePhysicalIdResolver, StackResourceSummaryCache, parse_time
     from samcli.commands.logs.puller_factory import generate_puller
-    from samcli.lib.observability.util import OutputOption
-    from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config, get_boto_resource_provider_with_config
+    from samcli.lib.observability.util import get_output_option
+    from samcli.lib.utils.boto_utils import (
+        get_boto_client_provider_from_session_with_config,
+        get_boto_resource_provider_from_session_with_config,
+        get_boto_session,
+    )
 
     if names and len(names) <= 1:
         click.echo(
@@ -158,12 +193,19 @@ def do_cli(
         )
 
     sanitized_start_time = parse_time(start_time, "start-time")
-    sanitized_end_time = parse_time(end_time, "end-time") or datetime.utcnow()
-
-    boto_client_provider = get_boto_client_provider_with_config(region=region, profile=profile)
-    boto_resource_provider = get_boto_resource_provider_with_config(region=region, profile=profile)
+    sanitized_end_time = parse_time(end_time, "end-time")
+
+    boto_session = get_boto_session(region, profile)
+    boto_client_provider = get_boto_client_provider_from_session_with_config(boto_session)
+    boto_resource_provider = get_boto_resource_provider_from_session_with_config(boto_session)
+    resource_summary_cache = None
+    # only cache with a named profile, credentials from environment or instance metadata can belong to any account
+    if stack_name and profile and not no_cache:
+        resource_summary_cache = StackResourceSummaryCache(
+            Path(GlobalConfig().config_dir, "logs-resource-cache", profile, boto_session.region_name)
+        )
     resource_logical_id_resolver = ResourcePhysicalIdResolver(
-        boto_resource_provider, boto_client_provider, stack_name, names
+        boto_resource_provider, boto_client_provider, stack_name, names, resource_summary_cache=resource_summary_cache
     )
 
     # only fetch all resources when no CloudWatch log group defined
@@ -173,14 +215,16 @@ def do_cli(
         resource_logical_id_resolver.get_resource_information(fetch_all_when_no_resource_name_given),
         filter_pattern,
         cw_log_groups,
-        OutputOption(output) if output else OutputOption.text,
+        get_output_option(output),
         include_tracing,
+        tailing and live_tail and _live_tail_supported(boto_client_provider),
     )
 
     if tailing:
         puller.tail(sanitized_start_time, filter_pattern)
     else:
-        puller.load_time_period(sanitized_start_time, sanitized_end_time, filter_pattern)
+        # tailing doesn't have an end time, only default it to now when loading a time period
+        puller.load_time_period(sanitized_start_time, sanitized_end_time or datetime.utcnow(), filter_pattern)
 
     if tailing:
         command_suggestions = generate_next_command_recommendation(
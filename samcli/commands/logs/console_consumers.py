@@ -2,6 +2,8 @@
 Consumers that will print out events to console
 """
 
+from typing import List
+
 import click
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
@@ -10,9 +12,14 @@ from samcli.lib.observability.observability_info_puller import ObservabilityEven
 
 class CWConsoleEventConsumer(ObservabilityEventConsumer[CWLogEvent]):
     """
-    Consumer implementation that will consume given event as outputting into console
+    Consumer implementation that will consume given event as outputting into console.
+    Events are buffered and written at once when the consumer is flushed (or buffer gets large), rather than
+    writing (and flushing) the console for each event
     """
 
+    # number of characters that will be buffered before writing them into console
+    MAX_BUFFER_SIZE = 8192
+
     def __init__(self, add_newline: bool = False):
         """
 
@@ -23,6 +30,19 @@ class CWConsoleEventConsumer(ObservabilityEventConsumer[CWLogEvent]):
             into same line when echo is called.
         """
         self._add_newline = add_newline
+        self._buffer: List[str] = []
+        self._buffer_size = 0
 
     def consume(self, event: CWLogEvent):
-        click.echo(event.message, nl=self._add_newline)
+        message = f"{event.message}\n" if self._add_newline else event.message
+        self._buffer.append(message)
+        self._buffer_size += len(message)
+        if self._buffer_size >= CWConsoleEventConsumer.MAX_BUFFER_SIZE:
+            self.flush()
+
+    def flush(self):
+        if not self._buffer:
+            return
+        click.echo("".join(self._buffer), nl=False)
+        self._buffer = []
+        self._buffer_size = 0
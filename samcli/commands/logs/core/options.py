@@ -11,7 +11,16 @@ from samcli.cli.row_modifiers import RowDefinition
 LOG_IDENTIFIER_OPTIONS: List[str] = ["stack_name", "cw_log_group", "name"]
 
 # Can be used instead of the options in the first list
-ADDITIONAL_OPTIONS: List[str] = ["include_traces", "filter", "output", "tail", "start_time", "end_time"]
+ADDITIONAL_OPTIONS: List[str] = [
+    "include_traces",
+    "filter",
+    "output",
+    "tail",
+    "live_tail",
+    "start_time",
+    "end_time",
+    "no_cache",
+]
 
 AWS_CREDENTIAL_OPTION_NAMES: List[str] = ["region", "profile"]
 
@@ -2,7 +2,11 @@
 Read and parse CLI args for the Logs Command and setup the context for running the command
 """
 
+import json
 import logging
+import re
+import time
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set
 
 from samcli.commands.exceptions import UserException
@@ -69,6 +73,67 @@ def parse_time(time_str: str, property_name: str):
         raise TimeParseError(f"Unable to parse the time information '{property_name}': '{time_str}'") from ex
 
 
+class StackResourceSummaryCache:
+    """
+    File based cache for the resource summaries of CloudFormation stacks. Cached entries expire after a short period
+    of time, so that consecutive invocations for the same stack don't need to query CloudFormation again
+    """
+
+    DEFAULT_TTL_SECONDS = 60
+
+    def __init__(self, cache_dir: Path, ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        """
+        Parameters
+        ----------
+        cache_dir : Path
+            Directory which will keep a cache file for each stack
+        ttl_seconds : int
+            Number of seconds that a cache file is valid after it is written
+        """
+        self._cache_dir = cache_dir
+        self._ttl_seconds = ttl_seconds
+
+    def get(self, stack_name: str) -> Optional[Dict[str, CloudFormationResourceSummary]]:
+        """
+        Returns cached resource summaries of the given stack, or None if there is no valid cache entry for it
+        """
+        cache_file = self._get_cache_file(stack_name)
+        try:
+            if time.time() - cache_file.stat().st_mtime > self._ttl_seconds:
+                LOG.debug("Cached resource summaries of stack (%s) are expired", stack_name)
+                return None
+            cached_summaries = json.loads(cache_file.read_text())
+            return {key: CloudFormationResourceSummary(*summary) for key, summary in cached_summaries.items()}
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as ex:
+            LOG.debug("Failed to read cached resource summaries of stack (%s)", stack_name, exc_info=ex)
+            return None
+
+    def put(self, stack_name: str, resource_summaries: Dict[str, CloudFormationResourceSummary]) -> None:
+        """
+        Writes resource summaries of the given stack into its cache file
+        """
+        cache_file = self._get_cache_file(stack_name)
+        try:
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_file.write_text(
+                json.dumps(
+                    {
+                        key: [summary.resource_type, summary.logical_resource_id, summary.physical_resource_id]
+                        for key, summary in resource_summaries.items()
+                    }
+                )
+            )
+        except OSError as ex:
+            LOG.debug("Failed to cache resource summaries of stack (%s)", stack_name, exc_info=ex)
+
+    def _get_cache_file(self, stack_name: str) -> Path:
+        # stack name can also be given as stack ARN, replace characters which are not safe for file names
+        file_name = re.sub(r"[^\w-]", "_", stack_name)
+        return self._cache_dir / f"{file_name}.json"
+
+
 class ResourcePhysicalIdResolver:
     """
     Wrapper class that is used to extract information about resources which we can tail their logs for given stack
@@ -89,6 +154,7 @@ class ResourcePhysicalIdResolver:
         stack_name: str,
         resource_names: Optional[List[str]] = None,
         supported_resource_types: Optional[Set[str]] = None,
+        resource_summary_cache: Optional[StackResourceSummaryCache] = None,
     ):
         self._boto_resource_provider = boto_resource_provider
         self._boto_client_provider = boto_client_provider
@@ -99,6 +165,7 @@ class ResourcePhysicalIdResolver:
             supported_resource_types = ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES
         self._supported_resource_types: Set[str] = supported_resource_types
         self._resource_names = set(resource_names)
+        self._resource_summary_cache = resource_summary_cache
 
     def get_resource_information(self, fetch_all_when_no_resource_name_given: bool = True) -> List[Any]:
         """
@@ -138,13 +205,20 @@ class ResourcePhysicalIdResolver:
         List[CloudFormationResourceSummary]
             List of resource information, which will be used to fetch the logs
         """
-        LOG.debug("Getting logical id of the all resources for stack '%s'", self._stack_name)
-        stack_resources = get_resource_summaries(
-            self._boto_resource_provider,
-            self._boto_client_provider,
-            self._stack_name,
-            ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES,
-        )
+        stack_resources = None
+        if self._resource_summary_cache:
+            stack_resources = self._resource_summary_cache.get(self._stack_name)
+
+        if stack_resources is None:
+            LOG.debug("Getting logical id of the all resources for stack '%s'", self._stack_name)
+            stack_resources = get_resource_summaries(
+                self._boto_resource_provider,
+                self._boto_client_provider,
+                self._stack_name,
+                ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES,
+            )
+            if self._resource_summary_cache:
+                self._resource_summary_cache.put(self._stack_name, stack_resources)
 
         if selected_resource_names:
             return self._get_selected_resources(stack_resources, selected_resource_names)
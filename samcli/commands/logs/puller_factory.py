@@ -19,7 +19,7 @@ from samcli.lib.observability.cw_logs.cw_log_formatters import (
     CWPrettyPrintFormatter,
 )
 from samcli.lib.observability.cw_logs.cw_log_group_provider import LogGroupProvider
-from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.observability.cw_logs.cw_log_puller import CWLogLiveTailPuller, CWLogPuller
 from samcli.lib.observability.observability_info_puller import (
     ObservabilityCombinedPuller,
     ObservabilityEventConsumer,
@@ -48,6 +48,7 @@ def generate_puller(
     additional_cw_log_groups: Optional[List[str]] = None,
     output: OutputOption = OutputOption.text,
     include_tracing: bool = False,
+    live_tail: bool = False,
 ) -> ObservabilityPuller:
     """
     This function will generate generic puller which can be used to
@@ -70,6 +71,8 @@ def generate_puller(
         between (default) text consumer or json consumer
     include_tracing: bool
         A flag to include the xray traces log or not
+    live_tail: bool
+        A flag to tail CloudWatch log groups with Live Tail sessions instead of polling them
 
     Returns
     -------
@@ -78,6 +81,7 @@ def generate_puller(
     if additional_cw_log_groups is None:
         additional_cw_log_groups = []
     pullers: List[ObservabilityPuller] = []
+    cw_log_puller_class = CWLogLiveTailPuller if live_tail else CWLogPuller
 
     # populate all puller instances for given resources
     for resource_information in resource_information_list:
@@ -92,7 +96,7 @@ def generate_puller(
 
         consumer = generate_consumer(filter_pattern, output, resource_information.logical_resource_id)
         pullers.append(
-            CWLogPuller(
+            cw_log_puller_class(
                 boto_client_provider("logs"),
                 consumer,
                 cw_log_group_name,
@@ -106,7 +110,7 @@ def generate_puller(
         logs_client = boto_client_provider("logs")
         _validate_cw_log_group_name(cw_log_group, logs_client)
         pullers.append(
-            CWLogPuller(
+            cw_log_puller_class(
                 logs_client,
                 consumer,
                 cw_log_group,
@@ -25,24 +25,26 @@ def stack_name_cw_log_group_validation(func):
 
     @wraps(func)
     def wrapped(*args, **kwargs):
-        ctx = click.get_current_context()
-        stack_name = ctx.params.get("stack_name")
-        cw_log_groups = ctx.params.get("cw_log_group")
-        names = ctx.params.get("name")
+        # click passes all parameters as keyword arguments, read them from there rather than the current context
+        stack_name = kwargs.get("stack_name")
+
+        # --stack-name satisfies both of the conditions below, which is the most common usage
+        if stack_name:
+            return func(*args, **kwargs)
 
         # if --name is provided --stack-name should be provided as well
-        if names and not stack_name:
+        if kwargs.get("name"):
             raise BadOptionUsage(
                 option_name="--stack-name",
-                ctx=ctx,
+                ctx=click.get_current_context(),
                 message="Missing option. Please provide '--stack-name' when using '--name' option",
             )
 
         # either --stack-name or --cw-log-group flags should be provided
-        if not stack_name and not cw_log_groups:
+        if not kwargs.get("cw_log_group"):
             raise BadOptionUsage(
                 option_name="--stack-name",
-                ctx=ctx,
+                ctx=click.get_current_context(),
                 message="Missing option. Please provide '--stack-name' or '--cw-log-group'",
             )
 
@@ -10,7 +10,7 @@ from samcli.cli.main import aws_creds_options, pass_context, print_cmdline_args
 from samcli.cli.main import common_options as cli_framework_options
 from samcli.commands._utils.command_exception_handler import command_exception_handler
 from samcli.commands._utils.options import common_observability_options
-from samcli.lib.observability.util import OutputOption
+from samcli.lib.observability.util import get_output_option
 from samcli.lib.telemetry.metric import track_command
 from samcli.lib.utils.version_checker import check_newer_version
 
@@ -78,7 +78,7 @@ def do_cli(trace_ids, start_time, end_time, tailing, output, region):
     xray_client = boto3.client("xray", config=boto_config)
 
     # generate puller depending on the parameters
-    puller = generate_trace_puller(xray_client, OutputOption(output) if output else OutputOption.text)
+    puller = generate_trace_puller(xray_client, get_output_option(output))
 
     if trace_ids:
         puller.load_events(trace_ids)
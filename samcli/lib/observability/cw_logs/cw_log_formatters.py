@@ -29,12 +29,12 @@ class CWKeywordHighlighterFormatter(ObservabilityEventMapper[CWLogEvent]):
             Keyword that will be highlighted
         """
         self._keyword = keyword
-        self._colored = colored
+        # highlighted keyword is same for all events, prepare it once rather than for each event
+        self._highlight = colored.underline(keyword) if keyword else None
 
     def map(self, event: CWLogEvent) -> CWLogEvent:
-        if self._keyword:
-            highlight = self._colored.underline(self._keyword)
-            event.message = event.message.replace(self._keyword, highlight)
+        if self._highlight:
+            event.message = event.message.replace(self._keyword, self._highlight)
 
         return event
 
@@ -10,6 +10,7 @@ from botocore.exceptions import ClientError
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
 from samcli.lib.observability.observability_info_puller import ObservabilityEventConsumer, ObservabilityPuller
+from samcli.lib.utils.boto_utils import get_client_error_code
 from samcli.lib.utils.time import to_datetime, to_timestamp
 
 LOG = logging.getLogger(__name__)
@@ -130,12 +131,13 @@ class CWLogPuller(ObservabilityPuller):
             # Several events will be returned. Consume one at a time
             for event in result.get("events", []):
                 self.had_data = True
-                cw_event = CWLogEvent(self.cw_log_group, dict(event), self.resource_name)
+                cw_event = CWLogEvent(self.cw_log_group, event, self.resource_name)
 
                 if cw_event.timestamp > self.latest_event_time:
                     self.latest_event_time = cw_event.timestamp
 
                 self.consumer.consume(cw_event)
+            self.consumer.flush()
 
             # Keep iterating until there are no more logs left to query.
             next_token = result.get("nextToken", None)
@@ -145,3 +147,152 @@ class CWLogPuller(ObservabilityPuller):
 
     def load_events(self, event_ids: Union[List[Any], Dict]):
         LOG.debug("Loading specific events are not supported via CloudWatch Log Group")
+
+
+class CWLogLiveTailPuller(CWLogPuller):
+    """
+    Puller implementation which tails events from CloudWatch log group with Live Tail (StartLiveTail API), so that
+    new events are pushed through a single stream instead of polling FilterLogEvents API.
+    It falls back to polling (see CWLogPuller.tail) if a Live Tail session can't be started for the log group, or if
+    streaming from the session fails.
+    """
+
+    def __init__(
+        self,
+        logs_client: Any,
+        consumer: ObservabilityEventConsumer,
+        cw_log_group: str,
+        resource_name: Optional[str] = None,
+        max_retries: int = 1000,
+        poll_interval: int = 1,
+    ):
+        super().__init__(logs_client, consumer, cw_log_group, resource_name, max_retries, poll_interval)
+        self._event_stream: Optional[Any] = None
+        self._session_started_at = 0
+        self._sampling_reported = False
+
+    def tail(self, start_time: Optional[datetime] = None, filter_pattern: Optional[str] = None):
+        try:
+            self._start_live_tail_session(filter_pattern)
+        except ClientError as err:
+            LOG.debug("Can't start Live Tail session for %s, falling back to polling", self.cw_log_group, exc_info=err)
+            super().tail(start_time, filter_pattern)
+            return
+
+        # Live Tail only streams events which are ingested after the session started, load the earlier ones first
+        if start_time:
+            self.load_time_period(start_time, filter_pattern=filter_pattern)
+
+        while not self.cancelled:
+            # Live Tail pushes events in the order they are ingested rather than by their timestamps, so only skip the
+            # events which could have been loaded before the session instead of the ones older than the latest
+            # streamed event
+            loaded_until = self.latest_event_time
+            try:
+                self._consume_live_tail_session(loaded_until)
+            except Exception as err:  # pylint: disable=broad-except
+                session_timed_out = (
+                    isinstance(err, ClientError) and get_client_error_code(err) == "SessionTimeoutException"
+                )
+                # closing the stream while stopping the tail interrupts reading from it
+                if not session_timed_out and not self.cancelled:
+                    LOG.warning(
+                        "Failed while streaming new log events of %s with Live Tail, falling back to polling",
+                        self.cw_log_group,
+                    )
+                    LOG.debug("Live Tail session failed", exc_info=err)
+                    super().tail(self._get_resume_time(), filter_pattern)
+                    return
+
+            if not self.cancelled and not self._restart_live_tail_session(filter_pattern):
+                return
+
+    def stop_tailing(self):
+        super().stop_tailing()
+        if self._event_stream:
+            self._event_stream.close()
+
+    def _start_live_tail_session(self, filter_pattern: Optional[str] = None):
+        kwargs: Dict[str, Any] = {"logGroupIdentifiers": [self._get_log_group_arn()]}
+        if filter_pattern:
+            kwargs["logEventFilterPattern"] = filter_pattern
+
+        LOG.debug("Starting Live Tail session with parameters %s", kwargs)
+        session_started_at = to_timestamp(datetime.utcnow())
+        self._event_stream = self.logs_client.start_live_tail(**kwargs).get("responseStream")
+        self._session_started_at = session_started_at
+
+    def _restart_live_tail_session(self, filter_pattern: Optional[str] = None) -> bool:
+        """
+        Starts a new Live Tail session after the previous one has ended, and loads the events which have been ingested
+        while there wasn't any session. Falls back to polling if the new session can't be started.
+
+        Parameters
+        ----------
+        filter_pattern : Optional[str]
+            Optional filter pattern which will be used to filter incoming events
+
+        Returns
+        -------
+        bool
+            True if a new session is started, False if it has fallen back to polling instead
+        """
+        resume_time = self._get_resume_time()
+        LOG.debug("Live Tail session for %s has ended, starting a new one", self.cw_log_group)
+        try:
+            self._start_live_tail_session(filter_pattern)
+        except ClientError as err:
+            LOG.debug(
+                "Can't restart Live Tail session for %s, falling back to polling", self.cw_log_group, exc_info=err
+            )
+            super().tail(resume_time, filter_pattern)
+            return False
+
+        if not self.cancelled:
+            self.load_time_period(resume_time, filter_pattern=filter_pattern)
+        return True
+
+    def _get_resume_time(self) -> datetime:
+        """
+        Returns the time to continue from, with the events which haven't been streamed by the previous session
+        """
+        resume_time: datetime = to_datetime(max(self.latest_event_time + 1, self._session_started_at))
+        return resume_time
+
+    def _consume_live_tail_session(self, loaded_until: int = 0):
+        for stream_event in self._event_stream or []:
+            if self.cancelled:
+                return
+
+            session_update = stream_event.get("sessionUpdate", {})
+            if session_update.get("sessionMetadata", {}).get("sampled") and not self._sampling_reported:
+                LOG.warning(
+                    "Live Tail is sampling the log events of %s because of their volume, "
+                    "some of the log events won't be displayed",
+                    self.cw_log_group,
+                )
+                self._sampling_reported = True
+
+            for event in session_update.get("sessionResults", []):
+                cw_event = CWLogEvent(self.cw_log_group, event, self.resource_name)
+
+                # skip the events which have already been loaded before the session started
+                if cw_event.timestamp <= loaded_until:
+                    continue
+
+                self.latest_event_time = max(self.latest_event_time, cw_event.timestamp)
+                self.consumer.consume(cw_event)
+            self.consumer.flush()
+
+    def _get_log_group_arn(self) -> str:
+        result = self.logs_client.describe_log_groups(logGroupNamePrefix=self.cw_log_group)
+        for log_group in result.get("logGroups", []):
+            if log_group.get("logGroupName") == self.cw_log_group:
+                # log group ARN ends with ':*' which is not accepted by StartLiveTail
+                log_group_arn = str(log_group.get("arn"))
+                return log_group_arn[:-2] if log_group_arn.endswith(":*") else log_group_arn
+
+        raise ClientError(
+            {"Error": {"Code": "ResourceNotFoundException", "Message": f"{self.cw_log_group} does not exist"}},
+            "DescribeLogGroups",
+        )
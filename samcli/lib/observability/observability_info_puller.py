@@ -130,6 +130,12 @@ class ObservabilityEventConsumer(Generic[ObservabilityEventType]):
             Event that will be consumed
         """
 
+    def flush(self):
+        """
+        Called by pullers after a batch of events have been consumed, so that consumers which buffer events can
+        process them at once. Default implementation does nothing
+        """
+
 
 class ObservabilityEventConsumerDecorator(ObservabilityEventConsumer):
     """
@@ -161,12 +167,21 @@ class ObservabilityEventConsumerDecorator(ObservabilityEventConsumer):
         LOG.debug("Calling consumer (%s) for event (%s)", self._consumer, event)
         self._consumer.consume(event)
 
+    def flush(self):
+        """
+        See Also ObservabilityEventConsumer.flush
+        """
+        self._consumer.flush()
+
 
 class ObservabilityCombinedPuller(ObservabilityPuller):
     """
     A decorator class which will contain multiple ObservabilityPuller instance and pull information from each of them
     """
 
+    # upper limit of the threads which are used to load events of the pullers in parallel
+    MAX_LOAD_WORKERS = 32
+
     def __init__(self, pullers: Sequence[ObservabilityPuller]):
         """
         Parameters
@@ -187,7 +202,8 @@ class ObservabilityCombinedPuller(ObservabilityPuller):
             async_context.add_async_task(puller.tail, start_time, filter_pattern)
         LOG.debug("Running all 'tail' tasks in parallel")
         try:
-            async_context.run_async()
+            # tail tasks run until they are cancelled, so each of them needs its own thread
+            async_context.run_async(max_workers=len(self._pullers))
         except KeyboardInterrupt:
             LOG.info(" CTRL+C received, cancelling...")
             self.stop_tailing()
@@ -207,7 +223,7 @@ class ObservabilityCombinedPuller(ObservabilityPuller):
             LOG.debug("Adding task 'load_time_period' for puller (%s)", puller)
             async_context.add_async_task(puller.load_time_period, start_time, end_time, filter_pattern)
         LOG.debug("Running all 'load_time_period' tasks in parallel")
-        async_context.run_async()
+        async_context.run_async(max_workers=min(len(self._pullers), ObservabilityCombinedPuller.MAX_LOAD_WORKERS))
 
     def load_events(self, event_ids: Union[List[Any], Dict]):
         """
@@ -2,6 +2,9 @@
 Utility classes and methods for observability commands and functionality
 """
 from enum import Enum
+from typing import Dict, Optional
+
+from samcli.commands.exceptions import UserException
 
 
 class OutputOption(Enum):  # pragma: no cover
@@ -11,3 +14,35 @@ class OutputOption(Enum):  # pragma: no cover
 
     text = "text"  # default
     json = "json"
+
+
+# mapping of --output values to OutputOption, to look them up without going through Enum's value lookup
+_OUTPUT_OPTIONS: Dict[str, OutputOption] = {output_option.value: output_option for output_option in OutputOption}
+
+
+def get_output_option(output: Optional[str]) -> OutputOption:
+    """
+    Returns OutputOption for the given --output value, defaults to OutputOption.text if no value is given
+
+    Parameters
+    ----------
+    output : Optional[str]
+        Value of the --output option
+
+    Returns
+    -------
+    OutputOption
+        Output option which matches with the given value
+
+    Raises
+    ------
+    UserException
+        If given value doesn't match with any of the output options
+    """
+    if not output:
+        return OutputOption.text
+
+    output_option = _OUTPUT_OPTIONS.get(output)
+    if not output_option:
+        raise UserException(f"Invalid output option '{output}'. Possible values are: {', '.join(_OUTPUT_OPTIONS)}")
+    return output_option
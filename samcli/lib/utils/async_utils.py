@@ -111,7 +111,7 @@ class AsyncContext:
         """
         self._async_tasks.append(partial(function, *args))
 
-    def run_async(self, default_executor=True):
+    def run_async(self, default_executor=True, max_workers=None):
         """
         Will run all collected functions in async context, and return their results in order
 
@@ -119,6 +119,8 @@ class AsyncContext:
         ----------
         default_executor: bool
             Determines if the async object will run using the default executor, or with a new created executor
+        max_workers: Optional[int]
+            Maximum number of threads of the executor, ThreadPoolExecutor's default is used if not given
 
         Returns
         -------
@@ -126,6 +128,8 @@ class AsyncContext:
         """
         event_loop = asyncio.new_event_loop()
         if not default_executor:
-            with ThreadPoolExecutor() as self.executor:
+            with ThreadPoolExecutor(max_workers=max_workers) as self.executor:
                 return run_given_tasks_async(self._async_tasks, event_loop, self.executor)
+        if max_workers:
+            event_loop.set_default_executor(ThreadPoolExecutor(max_workers=max_workers))
         return run_given_tasks_async(self._async_tasks, event_loop)
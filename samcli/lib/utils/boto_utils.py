@@ -1,6 +1,7 @@
 """
 This module contains utility functions for boto3 library
 """
+from functools import lru_cache
 from typing import Any, Optional
 
 from boto3 import Session
@@ -89,6 +90,26 @@ def get_boto_client_provider_with_config(
     )
 
 
+@lru_cache(maxsize=8)
+def get_boto_session(region: Optional[str] = None, profile: Optional[str] = None) -> Session:
+    """
+    Returns boto3 session for given region and profile. Sessions are cached by region and profile, so that the
+    providers which are created from the same session share loaded configuration files and service models.
+
+    Parameters
+    ----------
+    region: Optional[str]
+        AWS region name
+    profile: Optional[str]
+        Profile name from credentials
+
+    Returns
+    -------
+        Boto3 session object
+    """
+    return Session(region_name=region, profile_name=profile)
+
+
 def get_boto_resource_provider_from_session_with_config(session: Session, **kwargs) -> BotoProviderType:
     """
     Returns a wrapper function for boto resource with given configuration. It can be used like;
@@ -1,18 +1,20 @@
 import logging
-import shutil
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from subprocess import CalledProcessError, CompletedProcess, run
+from subprocess import DEVNULL, PIPE, CalledProcessError, CompletedProcess, run
 from typing import Optional
 from unittest import skipIf
 from parameterized import parameterized, parameterized_class
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 
 from tests.integration.local.common_utils import random_port
 from tests.integration.local.start_api.start_api_integ_base import StartApiIntegBaseClass
-from tests.testing_utils import get_sam_command, CI_OVERRIDE
+from tests.testing_utils import get_sam_command, remove_paths, CI_OVERRIDE
 
 LOG = logging.getLogger(__name__)
 
@@ -20,6 +22,7 @@ LOG = logging.getLogger(__name__)
 class TerraformStartApiIntegrationBase(StartApiIntegBaseClass):
     run_command_timeout = 300
     terraform_application: Optional[str] = None
+    session: requests.Session
 
     @classmethod
     def setUpClass(cls):
@@ -29,6 +32,9 @@ class TerraformStartApiIntegrationBase(StartApiIntegBaseClass):
         cls.command_list = [command, "local", "start-api", "--hook-name", "terraform", "--beta-features"]
         cls.test_data_path = Path(cls.get_integ_dir()) / "testdata" / "start_api"
         cls.project_directory = cls.test_data_path / "terraform" / cls.terraform_application
+        # reuse connections to the local API across the requests of the test class
+        cls.session = requests.Session()
+        cls.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
         super(TerraformStartApiIntegrationBase, cls).setUpClass()
 
     @staticmethod
@@ -38,23 +44,44 @@ class TerraformStartApiIntegrationBase(StartApiIntegBaseClass):
     @classmethod
     def tearDownClass(cls) -> None:
         super(TerraformStartApiIntegrationBase, cls).tearDownClass()
+        cls.session.close()
         cls._remove_generated_directories()
 
     @classmethod
     def _remove_generated_directories(cls):
-        shutil.rmtree(str(Path(cls.project_directory / ".aws-sam-iacs")), ignore_errors=True)
-        shutil.rmtree(str(Path(cls.project_directory / ".terraform")), ignore_errors=True)
-        try:
-            os.remove(str(Path(cls.project_directory / ".terraform.lock.hcl")))
-        except (FileNotFoundError, PermissionError):
-            pass
+        remove_paths(
+            Path(cls.project_directory / ".aws-sam-iacs"),
+            Path(cls.project_directory / ".terraform"),
+            Path(cls.project_directory / ".terraform.lock.hcl"),
+        )
 
     @classmethod
     def _run_command(cls, command, check) -> CompletedProcess:
         test_data_folder = (
             Path(cls.get_integ_dir()) / "testdata" / "start_api" / "terraform" / cls.terraform_application  # type: ignore
         )
-        return run(command, cwd=test_data_folder, check=check, capture_output=True, timeout=cls.run_command_timeout)
+        # only stderr is checked by the tests, don't hold the whole stdout of the command in memory
+        return run(
+            command,
+            cwd=test_data_folder,
+            check=check,
+            stdout=DEVNULL,
+            stderr=PIPE,
+            timeout=cls.run_command_timeout,
+            env=cls._get_command_env(),
+        )
+
+    @staticmethod
+    def _get_command_env():
+        # share downloaded terraform providers between the test projects, rather than downloading them for each one
+        env = os.environ.copy()
+        plugin_cache_dir = Path(
+            env.setdefault("TF_PLUGIN_CACHE_DIR", str(Path.home() / ".terraform.d" / "plugin-cache"))
+        )
+        plugin_cache_dir.mkdir(parents=True, exist_ok=True)
+        # the test projects don't keep a .terraform.lock.hcl, without it terraform 1.4+ ignores the cached providers
+        env.setdefault("TF_PLUGIN_CACHE_MAY_BREAK_DEPENDENCY_LOCK_FILE", "true")
+        return env
 
 
 class TerraformStartApiIntegrationApplyBase(TerraformStartApiIntegrationBase):
@@ -102,7 +129,7 @@ class TestStartApiTerraformApplication(TerraformStartApiIntegrationBase):
         self.url = "http://127.0.0.1:{}".format(self.port)
 
     def test_successful_request(self):
-        response = requests.get(self.url + "/hello", timeout=300)
+        response = self.session.get(self.url + "/hello", timeout=300)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"message": "hello world"})
@@ -148,21 +175,24 @@ class TestStartApiTerraformApplicationLimitations(TerraformStartApiIntegrationBa
         ]
         cls.test_data_path = Path(cls.get_integ_dir()) / "testdata" / "start_api"
         cls.project_directory = cls.test_data_path / "terraform" / cls.terraform_application
+        # compile the patterns once, rather than on each assertion of each (re)run
+        cls.expected_error_regex = re.compile(cls.expected_error_message)
+        cls.apply_disclaimer_regex = re.compile(
+            "Unresolvable attributes discovered in project, run terraform apply to resolve them."
+        )
 
     @classmethod
     def tearDownClass(cls) -> None:
         cls._remove_generated_directories()
 
     def test_unsupported_limitations(self):
-        apply_disclaimer_message = "Unresolvable attributes discovered in project, run terraform apply to resolve them."
-
         process = self._run_command(self.command_list, check=False)
 
         LOG.info(process.stderr)
         output = process.stderr.decode("utf-8")
         self.assertEqual(process.returncode, 1)
-        self.assertRegex(output, self.expected_error_message)
-        self.assertRegex(output, apply_disclaimer_message)
+        self.assertRegex(output, self.expected_error_regex)
+        self.assertRegex(output, self.apply_disclaimer_regex)
 
 
 @skipIf(
@@ -185,7 +215,7 @@ class TestStartApiTerraformApplicationLimitationsAfterApply(TerraformStartApiInt
         self.url = "http://127.0.0.1:{}".format(self.port)
 
     def test_successful_request(self):
-        response = requests.get(self.url + "/hello", timeout=300)
+        response = self.session.get(self.url + "/hello", timeout=300)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"message": "hello world"})
@@ -202,19 +232,28 @@ class TestStartApiTerraformApplicationV1LambdaAuthorizers(TerraformStartApiInteg
     def setUp(self):
         self.url = "http://127.0.0.1:{}".format(self.port)
 
-    @parameterized.expand(
-        [
+    def test_invoke_authorizer(self):
+        cases = [
             ("/hello", {"headers": {"myheader": "123"}}),
             ("/hello-request", {"headers": {"myheader": "123"}, "params": {"mystring": "456"}}),
             ("/hello-request-empty", {}),
             ("/hello-request-empty", {"headers": {"foo": "bar"}}),
         ]
-    )
-    def test_invoke_authorizer(self, endpoint, parameters):
-        response = requests.get(self.url + endpoint, timeout=300, **parameters)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.json(), {"message": "from authorizer"})
+        # send all requests at the same time, local API handles them in parallel.
+        # requests.Session isn't thread safe, so don't use the shared session of the test class here
+        with ThreadPoolExecutor(len(cases)) as thread_pool:
+            responses = list(
+                thread_pool.map(
+                    lambda case: requests.get(self.url + case[0], timeout=300, **case[1]),
+                    cases,
+                )
+            )
+
+        for (endpoint, parameters), response in zip(cases, responses):
+            with self.subTest(endpoint=endpoint, parameters=parameters):
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json(), {"message": "from authorizer"})
 
     @parameterized.expand(
         [
@@ -223,12 +262,12 @@ class TestStartApiTerraformApplicationV1LambdaAuthorizers(TerraformStartApiInteg
         ]
     )
     def test_missing_authorizer_identity_source(self, endpoint, parameters):
-        response = requests.get(self.url + endpoint, timeout=300, **parameters)
+        response = self.session.get(self.url + endpoint, timeout=300, **parameters)
 
         self.assertEqual(response.status_code, 401)
 
     def test_fails_token_header_validation_authorizer(self):
-        response = requests.get(self.url + "/hello", timeout=300, headers={"myheader": "not valid"})
+        response = self.session.get(self.url + "/hello", timeout=300, headers={"myheader": "not valid"})
 
         self.assertEqual(response.status_code, 401)
 
@@ -251,7 +290,7 @@ class TestStartApiTerraformApplicationOpenApiAuthorizer(TerraformStartApiIntegra
         ]
     )
     def test_successful_request(self, endpoint, params):
-        response = requests.get(self.url + endpoint, timeout=300, **params)
+        response = self.session.get(self.url + endpoint, timeout=300, **params)
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), {"message": "from authorizer"})
@@ -263,6 +302,6 @@ class TestStartApiTerraformApplicationOpenApiAuthorizer(TerraformStartApiIntegra
         ]
     )
     def test_missing_identity_sources(self, endpoint, params):
-        response = requests.get(self.url + endpoint, timeout=300, **params)
+        response = self.session.get(self.url + endpoint, timeout=300, **params)
 
         self.assertEqual(response.status_code, 401)
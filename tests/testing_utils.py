@@ -125,6 +125,23 @@ def kill_process(process: Popen) -> None:
         raise ValueError(f"Processes: {alive} are still alive.")
 
 
+def remove_paths(*paths: Path) -> None:
+    """Removes the given files and directories, ignoring the ones which don't exist.
+    Outside Windows this is done with a single `rm -rf` call, which is much faster than walking large trees
+    (like .terraform folders with provider binaries) in Python"""
+    if not IS_WINDOWS:
+        subprocess.run(["rm", "-rf", *[str(path) for path in paths]], check=False)
+        return
+    for path in paths:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            try:
+                os.remove(path)
+            except (FileNotFoundError, PermissionError):
+                pass
+
+
 def read_until_string(process: Popen, expected_output: str, timeout: int = 30) -> None:
     """Read output from process until a line equals to expected_output has shown up or reaching timeout.
     Throws TimeoutError if times out
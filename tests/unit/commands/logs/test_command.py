@@ -1,4 +1,6 @@
 import itertools
+from datetime import datetime
+from pathlib import Path
 from unittest import TestCase
 from unittest.mock import Mock, patch, call
 
@@ -7,7 +9,8 @@ from botocore.exceptions import ClientError
 from click.testing import CliRunner
 from parameterized import parameterized
 
-from samcli.commands.logs.command import do_cli, cli
+from samcli.cli.global_config import GlobalConfig
+from samcli.commands.logs.command import do_cli, cli, _live_tail_supported
 from samcli.lib.observability.util import OutputOption
 
 
@@ -25,25 +28,38 @@ class TestLogsCliCommand(TestCase):
 
     @parameterized.expand(
         itertools.product(
-            [True, False], [True, False], [[], ["cw_log_group"], ["cw_log_group", "cw_log_group2"]], ["text", "json"]
+            [True, False],
+            [True, False],
+            [[], ["cw_log_group"], ["cw_log_group", "cw_log_group2"]],
+            ["text", "json"],
+            [True, False],
+            [True, False],
         )
     )
+    @patch("samcli.commands.logs.command._live_tail_supported")
     @patch("samcli.commands.logs.puller_factory.generate_puller")
+    @patch("samcli.commands.logs.logs_context.StackResourceSummaryCache")
     @patch("samcli.commands.logs.logs_context.ResourcePhysicalIdResolver")
     @patch("samcli.commands.logs.logs_context.parse_time")
-    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_with_config")
-    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_session")
+    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_from_session_with_config")
     def test_logs_command(
         self,
         tailing,
         include_tracing,
         cw_log_group,
         output,
+        no_cache,
+        live_tail,
         patched_boto_resource_provider,
         patched_boto_client_provider,
+        patched_boto_session,
         patched_parse_time,
         patched_resource_physical_id_resolver,
+        patched_resource_summary_cache,
         patched_generate_puller,
+        patched_live_tail_supported,
         patched_is_experimental_enabled,
         patched_update_experimental_context,
     ):
@@ -59,6 +75,8 @@ class TestLogsCliCommand(TestCase):
         mocked_puller = Mock()
         patched_generate_puller.return_value = mocked_puller
 
+        patched_boto_session.return_value.region_name = self.region
+
         mocked_client_provider = Mock()
         patched_boto_client_provider.return_value = mocked_client_provider
 
@@ -75,6 +93,8 @@ class TestLogsCliCommand(TestCase):
             self.end_time,
             cw_log_group,
             output,
+            no_cache,
+            live_tail,
             self.region,
             self.profile,
         )
@@ -86,11 +106,25 @@ class TestLogsCliCommand(TestCase):
             ]
         )
 
-        patched_boto_client_provider.assert_called_with(region=self.region, profile=self.profile)
-        patched_boto_resource_provider.assert_called_with(region=self.region, profile=self.profile)
+        patched_boto_session.assert_called_with(self.region, self.profile)
+        patched_boto_client_provider.assert_called_with(patched_boto_session.return_value)
+        patched_boto_resource_provider.assert_called_with(patched_boto_session.return_value)
+
+        if no_cache:
+            patched_resource_summary_cache.assert_not_called()
+            expected_resource_summary_cache = None
+        else:
+            patched_resource_summary_cache.assert_called_once_with(
+                Path(GlobalConfig().config_dir, "logs-resource-cache", self.profile, self.region)
+            )
+            expected_resource_summary_cache = patched_resource_summary_cache.return_value
 
         patched_resource_physical_id_resolver.assert_called_with(
-            mocked_resource_provider, mocked_client_provider, self.stack_name, self.function_name
+            mocked_resource_provider,
+            mocked_client_provider,
+            self.stack_name,
+            self.function_name,
+            resource_summary_cache=expected_resource_summary_cache,
         )
 
         fetch_param = not bool(len(cw_log_group))
@@ -103,6 +137,7 @@ class TestLogsCliCommand(TestCase):
             cw_log_group,
             OutputOption(output),
             include_tracing,
+            tailing and live_tail and patched_live_tail_supported.return_value,
         )
 
         if tailing:
@@ -112,6 +147,69 @@ class TestLogsCliCommand(TestCase):
                 [call.load_time_period(mocked_start_time, mocked_end_time, self.filter_pattern)]
             )
 
+    @patch("samcli.commands.logs.command._live_tail_supported")
+    @patch("samcli.commands.logs.puller_factory.generate_puller")
+    @patch("samcli.commands.logs.logs_context.ResourcePhysicalIdResolver")
+    @patch("samcli.commands.logs.logs_context.parse_time")
+    @patch("samcli.lib.utils.boto_utils.get_boto_session")
+    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_from_session_with_config")
+    def test_logs_command_defaults_end_time_to_now(
+        self,
+        patched_boto_resource_provider,
+        patched_boto_client_provider,
+        patched_boto_session,
+        patched_parse_time,
+        patched_resource_physical_id_resolver,
+        patched_generate_puller,
+        patched_live_tail_supported,
+        patched_is_experimental_enabled,
+        patched_update_experimental_context,
+    ):
+        patched_parse_time.return_value = None
+        mocked_puller = Mock()
+        patched_generate_puller.return_value = mocked_puller
+
+        before = datetime.utcnow()
+        do_cli(None, None, None, False, False, None, None, ["cw_log_group"], None, True, False, None, None)
+
+        (start_time, end_time, filter_pattern), _ = mocked_puller.load_time_period.call_args
+        self.assertIsNone(start_time)
+        self.assertGreaterEqual(end_time, before)
+        self.assertLessEqual(end_time, datetime.utcnow())
+
+    @patch("samcli.commands.logs.command._live_tail_supported")
+    @patch("samcli.commands.logs.puller_factory.generate_puller")
+    @patch("samcli.commands.logs.logs_context.StackResourceSummaryCache")
+    @patch("samcli.commands.logs.logs_context.ResourcePhysicalIdResolver")
+    @patch("samcli.commands.logs.logs_context.parse_time")
+    @patch("samcli.lib.utils.boto_utils.get_boto_session")
+    @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_from_session_with_config")
+    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_from_session_with_config")
+    def test_logs_command_without_profile_doesnt_cache_resources(
+        self,
+        patched_boto_resource_provider,
+        patched_boto_client_provider,
+        patched_boto_session,
+        patched_parse_time,
+        patched_resource_physical_id_resolver,
+        patched_resource_summary_cache,
+        patched_generate_puller,
+        patched_live_tail_supported,
+        patched_is_experimental_enabled,
+        patched_update_experimental_context,
+    ):
+        do_cli(None, self.stack_name, None, False, False, None, None, [], None, False, False, self.region, None)
+
+        patched_resource_summary_cache.assert_not_called()
+        patched_resource_physical_id_resolver.assert_called_with(
+            patched_boto_resource_provider.return_value,
+            patched_boto_client_provider.return_value,
+            self.stack_name,
+            None,
+            resource_summary_cache=None,
+        )
+
     def test_without_stack_name_or_cw_log_group(
         self, patched_is_experimental_enabled, patched_update_experimental_context
     ):
@@ -172,3 +270,12 @@ class TestLogsCliCommand(TestCase):
         self.assertIn(
             f"Invalid --stack-name parameter. Stack with id '{invalid_stack_name}' does not exist", result.output
         )
+
+
+class TestLiveTailSupported(TestCase):
+    @parameterized.expand([(["StartLiveTail", "FilterLogEvents"], True), (["FilterLogEvents"], False)])
+    def test_live_tail_supported(self, operation_names, expected):
+        logs_client = Mock()
+        logs_client.meta.service_model.operation_names = operation_names
+
+        self.assertEqual(_live_tail_supported(lambda _: logs_client), expected)
@@ -16,16 +16,39 @@ class TestCWConsoleEventConsumer(TestCase):
     @patch("samcli.commands.logs.console_consumers.click")
     def test_consumer_with_event(self, add_newline, patched_click):
         consumer = CWConsoleEventConsumer(add_newline)
-        event = Mock()
+        event = Mock(message="message")
         consumer.consume(event)
+        consumer.flush()
 
-        expected_new_line_param = add_newline if add_newline is not None else True
-        patched_click.echo.assert_called_with(event.message, nl=expected_new_line_param)
+        expected_message = "message\n" if add_newline else "message"
+        patched_click.echo.assert_called_with(expected_message, nl=False)
 
     @patch("samcli.commands.logs.console_consumers.click")
     def test_default_consumer_with_event(self, patched_click):
         consumer = CWConsoleEventConsumer()
-        event = Mock()
+        event = Mock(message="message")
         consumer.consume(event)
+        consumer.flush()
 
-        patched_click.echo.assert_called_with(event.message, nl=False)
+        patched_click.echo.assert_called_with("message", nl=False)
+
+    @patch("samcli.commands.logs.console_consumers.click")
+    def test_consumer_writes_buffered_events_at_once(self, patched_click):
+        consumer = CWConsoleEventConsumer(True)
+        consumer.consume(Mock(message="message 1"))
+        consumer.consume(Mock(message="message 2"))
+
+        patched_click.echo.assert_not_called()
+
+        consumer.flush()
+        consumer.flush()
+
+        patched_click.echo.assert_called_once_with("message 1\nmessage 2\n", nl=False)
+
+    @patch("samcli.commands.logs.console_consumers.click")
+    def test_consumer_writes_when_buffer_is_full(self, patched_click):
+        consumer = CWConsoleEventConsumer()
+        message = "a" * CWConsoleEventConsumer.MAX_BUFFER_SIZE
+        consumer.consume(Mock(message=message))
+
+        patched_click.echo.assert_called_once_with(message, nl=False)
@@ -1,8 +1,14 @@
+import shutil
+import tempfile
+import time
+from pathlib import Path
 from unittest import TestCase, mock
 from unittest.mock import Mock, patch
 
+from parameterized import parameterized
+
 from samcli.commands.exceptions import UserException
-from samcli.commands.logs.logs_context import parse_time, ResourcePhysicalIdResolver
+from samcli.commands.logs.logs_context import parse_time, ResourcePhysicalIdResolver, StackResourceSummaryCache
 from samcli.lib.utils.cloudformation import CloudFormationResourceSummary
 from samcli.lib.utils.resources import AWS_CLOUDFORMATION_STACK
 
@@ -63,7 +69,8 @@ class TestLogsCommandContext(TestCase):
 
 
 class TestResourcePhysicalIdResolver(TestCase):
-    def test_get_resource_information_with_resources(self):
+    @parameterized.expand([(True,), (False,)])
+    def test_get_resource_information_with_resources(self, fetch_all_when_no_resource_name_given):
         resource_physical_id_resolver = ResourcePhysicalIdResolver(Mock(), Mock(), "stack_name", ["resource_name"])
         with mock.patch(
             "samcli.commands.logs.logs_context.ResourcePhysicalIdResolver._fetch_resources_from_stack"
@@ -71,9 +78,13 @@ class TestResourcePhysicalIdResolver(TestCase):
             expected_return = Mock()
             mocked_fetch.return_value = expected_return
 
-            actual_return = resource_physical_id_resolver.get_resource_information(False)
+            actual_return = resource_physical_id_resolver.get_resource_information(
+                fetch_all_when_no_resource_name_given
+            )
 
-            mocked_fetch.assert_called_once()
+            # given names are always passed on regardless of fetch_all_when_no_resource_name_given, the whole stack is
+            # still listed by _fetch_resources_from_stack and the given resources are selected from it afterwards
+            mocked_fetch.assert_called_once_with({"resource_name"})
             self.assertEqual(actual_return, expected_return)
 
     def test_get_resource_information_of_all_stack(self):
@@ -169,3 +180,79 @@ class TestResourcePhysicalIdResolver(TestCase):
             if item.resource_type in ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES and key in given_resources
         ]
         self.assertEqual(expected_results.sort(), actual_result.sort())
+
+    @patch("samcli.commands.logs.logs_context.get_resource_summaries")
+    def test_fetch_resources_from_cache(self, patched_get_resources):
+        resource_summary_cache = Mock()
+        cached_resources = {
+            "logical_id_1": CloudFormationResourceSummary(AWS_LAMBDA_FUNCTION, "logical_id_1", "physical_id_1")
+        }
+        resource_summary_cache.get.return_value = cached_resources
+        resource_physical_id_resolver = ResourcePhysicalIdResolver(
+            Mock(), Mock(), "stack_name", resource_summary_cache=resource_summary_cache
+        )
+
+        actual_result = resource_physical_id_resolver._fetch_resources_from_stack()
+
+        self.assertEqual(actual_result, list(cached_resources.values()))
+        resource_summary_cache.get.assert_called_once_with("stack_name")
+        patched_get_resources.assert_not_called()
+        resource_summary_cache.put.assert_not_called()
+
+    @patch("samcli.commands.logs.logs_context.get_resource_summaries")
+    def test_fetch_resources_writes_cache_when_missed(self, patched_get_resources):
+        resource_summary_cache = Mock()
+        resource_summary_cache.get.return_value = None
+        stack_resources = {
+            "logical_id_1": CloudFormationResourceSummary(AWS_LAMBDA_FUNCTION, "logical_id_1", "physical_id_1")
+        }
+        patched_get_resources.return_value = stack_resources
+        resource_physical_id_resolver = ResourcePhysicalIdResolver(
+            Mock(), Mock(), "stack_name", resource_summary_cache=resource_summary_cache
+        )
+
+        actual_result = resource_physical_id_resolver._fetch_resources_from_stack()
+
+        self.assertEqual(actual_result, list(stack_resources.values()))
+        resource_summary_cache.put.assert_called_once_with("stack_name", stack_resources)
+
+
+class TestStackResourceSummaryCache(TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        self.resource_summaries = {
+            "logical_id_1": CloudFormationResourceSummary(AWS_LAMBDA_FUNCTION, "logical_id_1", "physical_id_1"),
+            "StackA/logical_id_2": CloudFormationResourceSummary(
+                AWS_APIGATEWAY_RESTAPI, "logical_id_2", "physical_id_2"
+            ),
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_put_and_get(self):
+        cache = StackResourceSummaryCache(self.cache_dir / "nested")
+        cache.put("stack_name", self.resource_summaries)
+
+        self.assertEqual(cache.get("stack_name"), self.resource_summaries)
+        self.assertIsNone(cache.get("other_stack_name"))
+
+    def test_stack_arn_as_stack_name(self):
+        stack_arn = "arn:aws:cloudformation:us-east-1:123456789012:stack/stack_name/id"
+        cache = StackResourceSummaryCache(self.cache_dir)
+        cache.put(stack_arn, self.resource_summaries)
+
+        self.assertEqual(cache.get(stack_arn), self.resource_summaries)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+
+    def test_expired_entry(self):
+        cache = StackResourceSummaryCache(self.cache_dir, ttl_seconds=60)
+        cache.put("stack_name", self.resource_summaries)
+
+        with patch("samcli.commands.logs.logs_context.time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get("stack_name"))
+
+    def test_invalid_entry(self):
+        (self.cache_dir / "stack_name.json").write_text("not json")
+
+        self.assertIsNone(StackResourceSummaryCache(self.cache_dir).get("stack_name"))
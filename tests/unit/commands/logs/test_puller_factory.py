@@ -136,6 +136,26 @@ class TestPullerFactory(TestCase):
 
         patched_text_consumer.assert_has_calls([call(None) for _ in mock_cw_log_groups])
 
+    @patch("samcli.commands.logs.puller_factory.generate_text_consumer")
+    @patch("samcli.commands.logs.puller_factory.CWLogLiveTailPuller")
+    @patch("samcli.commands.logs.puller_factory.CWLogPuller")
+    @patch("samcli.commands.logs.puller_factory.ObservabilityCombinedPuller")
+    def test_generate_puller_with_live_tail(
+        self, patched_combined_puller, patched_cw_log_puller, patched_live_tail_puller, patched_text_consumer
+    ):
+        mock_logs_client = Mock()
+        mock_cw_log_groups = [Mock(), Mock()]
+
+        mocked_pullers = [Mock() for _ in mock_cw_log_groups]
+        patched_live_tail_puller.side_effect = mocked_pullers
+
+        generate_puller(
+            lambda client: mock_logs_client, [], additional_cw_log_groups=mock_cw_log_groups, live_tail=True
+        )
+
+        patched_cw_log_puller.assert_not_called()
+        patched_combined_puller.assert_called_with(mocked_pullers)
+
     @parameterized.expand(
         [
             (OutputOption.json,),
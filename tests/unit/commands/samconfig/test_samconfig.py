@@ -840,6 +840,8 @@ class TestSamConfigForAllCommands(TestCase):
                 "endtime",
                 (),
                 None,
+                False,
+                False,
                 "myregion",
                 None,
             )
@@ -852,6 +854,7 @@ class TestSamConfigForAllCommands(TestCase):
             "stack_name": "mystack",
             "filter": "myfilter",
             "tail": True,
+            "live_tail": True,
             "include_traces": True,
             "start_time": "starttime",
             "end_time": "endtime",
@@ -882,6 +885,8 @@ class TestSamConfigForAllCommands(TestCase):
                 "endtime",
                 ("cw_log_group",),
                 None,
+                False,
+                True,
                 "myregion",
                 None,
             )
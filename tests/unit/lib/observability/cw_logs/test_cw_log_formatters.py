@@ -79,15 +79,26 @@ class CWCWKeywordHighlighterFormatter(TestCase):
         color_result = "colored"
         expected_msg = "this colored some colored other colored"
 
+        self.colored.underline.return_value = color_result
         formatter = CWKeywordHighlighterFormatter(self.colored, keyword)
 
-        self.colored.underline.return_value = color_result
         event = CWLogEvent("group_name", {"message": input_msg})
 
         result = formatter.map(event)
         self.assertEqual(result.message, expected_msg)
         self.colored.underline.assert_called_with(keyword)
 
+    def test_must_highlight_keyword_once_for_all_events(self):
+        keyword = "keyword"
+        self.colored.underline.return_value = "colored"
+        formatter = CWKeywordHighlighterFormatter(self.colored, keyword)
+
+        for _ in range(3):
+            result = formatter.map(CWLogEvent("group_name", {"message": "this keyword"}))
+            self.assertEqual(result.message, "this colored")
+
+        self.colored.underline.assert_called_once_with(keyword)
+
     def test_must_ignore_if_keyword_is_absent(self):
         input_msg = "this keyword some keyword other keyword"
         event = CWLogEvent("group_name", {"message": input_msg})
@@ -1,13 +1,15 @@
 import copy
 from datetime import datetime
 from unittest import TestCase
-from unittest.mock import Mock, call, patch, ANY
+from unittest.mock import MagicMock, Mock, call, patch, ANY
 
 import botocore.session
+from botocore.exceptions import ClientError
 from botocore.stub import Stubber
+from parameterized import parameterized
 
 from samcli.lib.observability.cw_logs.cw_log_event import CWLogEvent
-from samcli.lib.observability.cw_logs.cw_log_puller import CWLogPuller
+from samcli.lib.observability.cw_logs.cw_log_puller import CWLogLiveTailPuller, CWLogPuller
 from samcli.lib.utils.time import to_timestamp, to_datetime
 
 LOG_CLIENT = botocore.session.get_session().create_client("logs", region_name="us-east-1")
@@ -168,6 +170,9 @@ class TestCWLogPuller_load_time_period(TestCWLogPullerBase):
             for event in expected_events_result:
                 self.assertIn(event, call_args)
 
+            # consumer is flushed once per page
+            self.assertEqual(self.consumer.flush.call_count, 3)
+
 
 class TestCWLogPuller_tail(TestCWLogPullerBase):
     def setUp(self):
@@ -386,3 +391,213 @@ class TestCWLogPuller_tail(TestCWLogPullerBase):
                 self.consumer.consume.assert_not_called()
                 self.assertEqual(expected_load_time_period_calls, patched_load_time_period.call_args_list)
                 time_mock.sleep.assert_has_calls(expected_time_calls, any_order=True)
+
+
+class TestCWLogLiveTailPuller(TestCase):
+    def setUp(self):
+        self.log_group_name = "name"
+        self.log_group_arn = "arn:aws:logs:us-east-1:123456789012:log-group:name"
+        self.filter_pattern = "pattern"
+        self.consumer = Mock()
+        self.logs_client = Mock()
+        self.logs_client.describe_log_groups.return_value = {
+            "logGroups": [{"logGroupName": self.log_group_name, "arn": f"{self.log_group_arn}:*"}]
+        }
+        self.puller = CWLogLiveTailPuller(self.logs_client, self.consumer, self.log_group_name)
+
+    def _stream_response(self, *timestamps):
+        return self._stream_response_with_events(*[{"timestamp": timestamp} for timestamp in timestamps])
+
+    def _stream_response_with_events(self, *events):
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(
+            [
+                {"sessionStart": {}},
+                {"sessionUpdate": {"sessionResults": list(events)}},
+            ]
+        )
+        return {"responseStream": stream}
+
+    def test_must_consume_events_from_live_tail_session(self):
+        def stop_after_first_session(**kwargs):
+            self.logs_client.start_live_tail.side_effect = lambda **_: self.puller.stop_tailing() or {}
+            return self._stream_response(11, 12)
+
+        self.logs_client.start_live_tail.side_effect = stop_after_first_session
+
+        self.puller.tail(filter_pattern=self.filter_pattern)
+
+        self.logs_client.start_live_tail.assert_called_with(
+            logGroupIdentifiers=[self.log_group_arn], logEventFilterPattern=self.filter_pattern
+        )
+        self.assertEqual(
+            [args[0] for (args, _) in self.consumer.consume.call_args_list],
+            [CWLogEvent(self.log_group_name, {"timestamp": 11}), CWLogEvent(self.log_group_name, {"timestamp": 12})],
+        )
+
+    def test_must_consume_out_of_order_events_from_different_streams(self):
+        events = [
+            {"timestamp": 1005, "logStreamName": "b", "message": "b1"},
+            {"timestamp": 1000, "logStreamName": "a", "message": "a1"},
+            {"timestamp": 1005, "logStreamName": "b", "message": "b2"},
+        ]
+
+        def stop_after_first_session(**kwargs):
+            self.logs_client.start_live_tail.side_effect = lambda **_: self.puller.stop_tailing() or {}
+            return self._stream_response_with_events(*events)
+
+        self.logs_client.start_live_tail.side_effect = stop_after_first_session
+
+        self.puller.tail()
+
+        self.assertEqual(
+            [args[0] for (args, _) in self.consumer.consume.call_args_list],
+            [CWLogEvent(self.log_group_name, event) for event in events],
+        )
+        self.assertEqual(self.puller.latest_event_time, 1005)
+
+    def test_must_load_events_before_start_time_and_skip_duplicates(self):
+        self.logs_client.start_live_tail.return_value = self._stream_response(11, 12, 10, 13)
+
+        def load_time_period(*args, **kwargs):
+            self.puller.latest_event_time = 12
+
+        def consume(event):
+            self.puller.stop_tailing()
+
+        self.consumer.consume.side_effect = consume
+
+        with patch.object(self.puller, "load_time_period", side_effect=load_time_period) as patched_load_time_period:
+            self.puller.tail(to_datetime(10), self.filter_pattern)
+
+        patched_load_time_period.assert_called_once_with(to_datetime(10), filter_pattern=self.filter_pattern)
+        self.consumer.consume.assert_called_once_with(CWLogEvent(self.log_group_name, {"timestamp": 13}))
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.CWLogPuller.tail")
+    def test_must_fall_back_to_polling_when_live_tail_fails(self, patched_tail):
+        self.logs_client.start_live_tail.side_effect = ClientError(
+            {"Error": {"Code": "AccessDeniedException"}}, "StartLiveTail"
+        )
+
+        self.puller.tail(to_datetime(10), self.filter_pattern)
+
+        patched_tail.assert_called_once_with(to_datetime(10), self.filter_pattern)
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.CWLogPuller.tail")
+    def test_must_fall_back_to_polling_when_log_group_does_not_exist(self, patched_tail):
+        self.logs_client.describe_log_groups.return_value = {"logGroups": []}
+
+        self.puller.tail(None, self.filter_pattern)
+
+        self.logs_client.start_live_tail.assert_not_called()
+        patched_tail.assert_called_once_with(None, self.filter_pattern)
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.LOG")
+    def test_must_warn_once_when_events_are_sampled(self, patched_log):
+        sampled_update = {
+            "sessionUpdate": {"sessionMetadata": {"sampled": True}, "sessionResults": [{"timestamp": 11}]}
+        }
+        stream = MagicMock()
+        stream.__iter__.return_value = iter(
+            [
+                {"sessionUpdate": {"sessionMetadata": {"sampled": False}, "sessionResults": [{"timestamp": 10}]}},
+                sampled_update,
+                sampled_update,
+            ]
+        )
+        self.puller._event_stream = stream
+
+        self.puller._consume_live_tail_session()
+
+        self.assertEqual(self.consumer.consume.call_count, 3)
+        patched_log.warning.assert_called_once_with(ANY, self.log_group_name)
+
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.datetime")
+    def test_must_load_events_between_sessions_when_session_ends(self, patched_datetime):
+        patched_datetime.utcnow.return_value = to_datetime(10)
+        sessions = iter([self._stream_response(11, 12), self._stream_response(13, 14)])
+
+        def start_live_tail(**kwargs):
+            session = next(sessions, None)
+            if not session:
+                self.puller.stop_tailing()
+                return {}
+            return session
+
+        self.logs_client.start_live_tail.side_effect = start_live_tail
+
+        def load_time_period(*args, **kwargs):
+            # event which has been ingested while the new session was starting
+            self.puller.latest_event_time = 13
+
+        with patch.object(self.puller, "load_time_period", side_effect=load_time_period) as patched_load_time_period:
+            self.puller.tail(None, self.filter_pattern)
+
+        patched_load_time_period.assert_called_once_with(to_datetime(13), filter_pattern=self.filter_pattern)
+        self.assertEqual(
+            [args[0] for (args, _) in self.consumer.consume.call_args_list],
+            [
+                CWLogEvent(self.log_group_name, {"timestamp": 11}),
+                CWLogEvent(self.log_group_name, {"timestamp": 12}),
+                CWLogEvent(self.log_group_name, {"timestamp": 14}),
+            ],
+        )
+
+    @parameterized.expand([(15, 16), (5, 10)])
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.datetime")
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.CWLogPuller.tail")
+    def test_must_fall_back_to_polling_when_live_tail_restart_fails(
+        self, latest_streamed_event_time, expected_poll_start_time, patched_tail, patched_datetime
+    ):
+        patched_datetime.utcnow.return_value = to_datetime(10)
+
+        def fail_after_first_session(**kwargs):
+            self.logs_client.start_live_tail.side_effect = ClientError(
+                {"Error": {"Code": "LimitExceededException"}}, "StartLiveTail"
+            )
+            return self._stream_response(latest_streamed_event_time)
+
+        self.logs_client.start_live_tail.side_effect = fail_after_first_session
+
+        self.puller.tail(None, self.filter_pattern)
+
+        self.assertEqual(self.logs_client.start_live_tail.call_count, 2)
+        self.consumer.consume.assert_called_once_with(
+            CWLogEvent(self.log_group_name, {"timestamp": latest_streamed_event_time})
+        )
+        patched_tail.assert_called_once_with(to_datetime(expected_poll_start_time), self.filter_pattern)
+
+    @parameterized.expand(
+        [
+            (ClientError({"Error": {"Code": "SessionStreamingException"}}, "StartLiveTail"),),
+            (ConnectionError(),),
+        ]
+    )
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.datetime")
+    @patch("samcli.lib.observability.cw_logs.cw_log_puller.CWLogPuller.tail")
+    def test_must_fall_back_to_polling_on_stream_errors(self, stream_error, patched_tail, patched_datetime):
+        patched_datetime.utcnow.return_value = to_datetime(10)
+
+        def fail_after_first_event(*args):
+            yield {"sessionUpdate": {"sessionResults": [{"timestamp": 15}]}}
+            raise stream_error
+
+        stream = MagicMock()
+        stream.__iter__.side_effect = fail_after_first_event
+        self.logs_client.start_live_tail.return_value = {"responseStream": stream}
+
+        self.puller.tail(None, self.filter_pattern)
+
+        self.logs_client.start_live_tail.assert_called_once()
+        self.consumer.consume.assert_called_once_with(CWLogEvent(self.log_group_name, {"timestamp": 15}))
+        patched_tail.assert_called_once_with(to_datetime(16), self.filter_pattern)
+
+    def test_stop_tailing_closes_stream(self):
+        stream = MagicMock()
+        self.logs_client.start_live_tail.return_value = {"responseStream": stream}
+        self.puller._start_live_tail_session()
+
+        self.puller.stop_tailing()
+
+        self.assertTrue(self.puller.cancelled)
+        stream.close.assert_called_once()
@@ -19,6 +19,14 @@ class TestObservabilityEventConsumerDecorator(TestCase):
 
         actual_consumer.consume.assert_called_with(event)
 
+    def test_decorator_flush(self):
+        actual_consumer = Mock()
+
+        consumer_decorator = ObservabilityEventConsumerDecorator([], actual_consumer)
+        consumer_decorator.flush()
+
+        actual_consumer.flush.assert_called_once()
+
     def test_decorator_with_mapper(self):
         actual_consumer = Mock()
         event = Mock()
@@ -73,7 +81,7 @@ class TestObservabilityCombinedPuller(TestCase):
             [
                 call.add_async_task(mock_puller_1.tail, given_start_time, given_filter_pattern),
                 call.add_async_task(mock_puller_2.tail, given_start_time, given_filter_pattern),
-                call.run_async(),
+                call.run_async(max_workers=2),
             ]
         )
 
@@ -101,7 +109,7 @@ class TestObservabilityCombinedPuller(TestCase):
                 call.add_async_task(mock_puller_1.tail, given_start_time, given_filter_pattern),
                 call.add_async_task(mock_puller_2.tail, given_start_time, given_filter_pattern),
                 call.add_async_task(child_combined_puller.tail, given_start_time, given_filter_pattern),
-                call.run_async(),
+                call.run_async(max_workers=3),
             ]
         )
 
@@ -133,10 +141,22 @@ class TestObservabilityCombinedPuller(TestCase):
                 call.add_async_task(
                     mock_puller_2.load_time_period, given_start_time, given_end_time, given_filter_pattern
                 ),
-                call.run_async(),
+                call.run_async(max_workers=2),
             ]
         )
 
+    @patch("samcli.lib.observability.observability_info_puller.AsyncContext")
+    def test_load_time_period_limits_max_workers(self, patched_async_context):
+        mocked_async_context = Mock()
+        patched_async_context.return_value = mocked_async_context
+
+        combined_puller = ObservabilityCombinedPuller(
+            [Mock() for _ in range(ObservabilityCombinedPuller.MAX_LOAD_WORKERS + 1)]
+        )
+        combined_puller.load_time_period()
+
+        mocked_async_context.run_async.assert_called_once_with(max_workers=ObservabilityCombinedPuller.MAX_LOAD_WORKERS)
+
     @patch("samcli.lib.observability.observability_info_puller.AsyncContext")
     def test_load_events(self, patched_async_context):
         mocked_async_context = Mock()
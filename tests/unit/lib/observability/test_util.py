@@ -0,0 +1,25 @@
+from unittest import TestCase
+
+from parameterized import parameterized
+
+from samcli.commands.exceptions import UserException
+from samcli.lib.observability.util import OutputOption, get_output_option
+
+
+class TestGetOutputOption(TestCase):
+    @parameterized.expand(
+        [
+            (None, OutputOption.text),
+            ("", OutputOption.text),
+            ("text", OutputOption.text),
+            ("json", OutputOption.json),
+        ]
+    )
+    def test_get_output_option(self, output, expected_output_option):
+        self.assertEqual(get_output_option(output), expected_output_option)
+
+    def test_invalid_output_option(self):
+        with self.assertRaises(UserException) as ex:
+            get_output_option("yaml")
+
+        self.assertIn("Invalid output option 'yaml'", str(ex.exception))
@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
-from time import sleep, time
+from unittest.mock import patch
+from time import sleep
 
 from parameterized import parameterized
 
@@ -43,3 +45,25 @@ class TestAsyncContext(TestCase):
         async_context.add_async_task(raises_exception)
 
         self.assertRaises(Exception, async_context.run_async)
+
+    @parameterized.expand([(True,), (False,)])
+    def test_async_execution_with_max_workers(self, default_executor):
+        async_context = AsyncContext()
+        for _ in range(4):
+            async_context.add_async_task(hello_world)
+
+        with patch("samcli.lib.utils.async_utils.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as patched_executor:
+            results = async_context.run_async(default_executor=default_executor, max_workers=4)
+
+        self.assertEqual(results, ["Hello World"] * 4)
+        patched_executor.assert_called_once_with(max_workers=4)
+
+    def test_async_execution_without_max_workers_uses_default_executor(self):
+        async_context = AsyncContext()
+        async_context.add_async_task(hello_world)
+
+        with patch("samcli.lib.utils.async_utils.ThreadPoolExecutor", wraps=ThreadPoolExecutor) as patched_executor:
+            results = async_context.run_async()
+
+        self.assertEqual(results, ["Hello World"])
+        patched_executor.assert_not_called()
@@ -10,6 +10,7 @@ from samcli.lib.utils.boto_utils import (
     get_boto_resource_provider_from_session_with_config,
     get_boto_client_provider_from_session_with_config,
     get_client_error_code,
+    get_boto_session,
 )
 
 TEST_VERSION = "1.0.0"
@@ -81,6 +82,22 @@ class TestBotoUtils(TestCase):
         patched_get_client.assert_called_with(given_session, param=given_config_param)
         self.assertEqual(given_client_generator, client_generator)
 
+    @patch("samcli.lib.utils.boto_utils.Session")
+    def test_get_boto_session(self, patched_session):
+        get_boto_session.cache_clear()
+        self.addCleanup(get_boto_session.cache_clear)
+
+        session = get_boto_session("us-west-2", "profile")
+        same_session = get_boto_session("us-west-2", "profile")
+        other_session = get_boto_session("us-east-1", "profile")
+
+        self.assertIs(session, same_session)
+        self.assertEqual(session, patched_session.return_value)
+        self.assertEqual(other_session, patched_session.return_value)
+        patched_session.assert_any_call(region_name="us-west-2", profile_name="profile")
+        patched_session.assert_any_call(region_name="us-east-1", profile_name="profile")
+        self.assertEqual(patched_session.call_count, 2)
+
     @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_from_session_with_config")
     @patch("samcli.lib.utils.boto_utils.Session")
     def test_get_boto_resource_provider_with_config(self, patched_session, patched_get_resource):